@@ -3,7 +3,9 @@ import os
 from contextlib import asynccontextmanager
 import logging
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .odata.router import router as odata_router
 from .odata.registry import (
@@ -14,6 +16,13 @@ from .odata.registry import (
 
 logger = logging.getLogger(__name__)
 
+# Config-source environment, read once at import. These are set by the pod
+# spec at process start and never change at runtime in Kubernetes.
+_REPO_ROOT = Path(os.getenv("DP_REPO_ROOT", "/app"))
+_DP_LOCAL_CR = os.getenv("DP_LOCAL_CR")
+_DP_METADATA_PATH = os.getenv("DP_METADATA_PATH")
+_CONFIG_DIR = os.getenv("CONFIG_DIR")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -27,11 +36,11 @@ async def lifespan(app: FastAPI):
       3. CONFIG_DIR       -> load engine YAML configs from a directory
       4. Otherwise: start with empty registry
     """
-    repo_root = Path(os.getenv("DP_REPO_ROOT", "/app"))
+    repo_root = _REPO_ROOT
 
-    dp_local_cr = os.getenv("DP_LOCAL_CR")
-    dp_metadata_path = os.getenv("DP_METADATA_PATH")
-    config_dir_env = os.getenv("CONFIG_DIR")
+    dp_local_cr = _DP_LOCAL_CR
+    dp_metadata_path = _DP_METADATA_PATH
+    config_dir_env = _CONFIG_DIR
 
     try:
         if dp_local_cr:
@@ -60,14 +69,18 @@ async def lifespan(app: FastAPI):
     # no explicit shutdown logic yet
 
 
-app = FastAPI(title="data-product-hub", lifespan=lifespan)
+app = FastAPI(
+    title="data-product-hub",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # OData routes
 app.include_router(odata_router)
 
 
 @app.post("/internal/reload-config")
-def reload_config():
+async def reload_config():
     """
     Reload configuration at runtime, using the same precedence as startup:
 
@@ -76,29 +89,34 @@ def reload_config():
       3. CONFIG_DIR       -> re-load YAML configs from that directory.
 
     Otherwise: no-op.
+
+    The loaders do blocking disk I/O, YAML/JSON parsing and DuckDB DDL, so
+    they run on a worker thread to keep the event loop responsive during
+    long reloads. Concurrent reloads are serialized by the loaders' module
+    load lock.
     """
-    repo_root = Path(os.getenv("DP_REPO_ROOT", "/app"))
+    repo_root = _REPO_ROOT
 
-    dp_local_cr = os.getenv("DP_LOCAL_CR")
-    dp_metadata_path = os.getenv("DP_METADATA_PATH")
-    config_dir_env = os.getenv("CONFIG_DIR")
+    dp_local_cr = _DP_LOCAL_CR
+    dp_metadata_path = _DP_METADATA_PATH
+    config_dir_env = _CONFIG_DIR
 
     if dp_local_cr:
         cr_path = Path(dp_local_cr)
         logger.info("Reloading configuration from local CR: %s", cr_path)
-        load_from_cr_manifest(cr_path, repo_root=repo_root)
+        await anyio.to_thread.run_sync(load_from_cr_manifest, cr_path, repo_root)
         return {"status": "ok", "mode": "local-cr", "path": str(cr_path)}
 
     if dp_metadata_path:
         metadata_path = Path(dp_metadata_path)
         logger.info("Reloading configuration from metadata file: %s", metadata_path)
-        load_from_metadata_file(metadata_path, repo_root=repo_root)
+        await anyio.to_thread.run_sync(load_from_metadata_file, metadata_path, repo_root)
         return {"status": "ok", "mode": "metadata-file", "path": str(metadata_path)}
 
     if config_dir_env:
         config_dir = Path(config_dir_env)
         logger.info("Reloading configuration from CONFIG_DIR: %s", config_dir)
-        load_config_dir(config_dir)
+        await anyio.to_thread.run_sync(load_config_dir, config_dir)
         return {"status": "ok", "mode": "config-dir", "path": str(config_dir)}
 
     logger.info("reload-config: no configuration source set, no-op.")
@@ -1,12 +1,36 @@
 # src/engine/odata/filter.py
 
 from typing import Optional, Tuple, List
+import functools
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Single alternation compiled once at import: the expression is scanned
+# in one pass and each keyword rewritten via the dispatch map below.
+_OPS_RE = re.compile(
+    r"\b(eq|ne|gt|ge|lt|le|and|or|true|false|null)\b", re.IGNORECASE
+)
+_SQL_MAP = {
+    "eq": "=",
+    "ne": "<>",
+    "gt": ">",
+    "ge": ">=",
+    "lt": "<",
+    "le": "<=",
+    "and": "AND",
+    "or": "OR",
+    "true": "TRUE",
+    "false": "FALSE",
+    "null": "NULL",
+}
+_WS_RE = re.compile(r"\s+")
+_QUOTED_RE = re.compile(r"'[^']*'")
+_IDENT_RE = re.compile(r"\b[A-Za-z_]\w*\b")
 
+
+@functools.lru_cache(maxsize=512)
 def _translate_odata_to_sql(filter_expr: str) -> str:
     """
     Translate a subset of OData $filter syntax into a SQL expression
@@ -23,31 +47,30 @@ def _translate_odata_to_sql(filter_expr: str) -> str:
       * We do not yet support functions (startswith, substring, etc.).
       * This is intended for internal usage, not arbitrary external user input.
     """
-    expr = filter_expr
-
-    # Map OData keywords to SQL equivalents using word-boundary regexes
-    replacements = {
-        r"\beq\b": "=",
-        r"\bne\b": "<>",
-        r"\bgt\b": ">",
-        r"\bge\b": ">=",
-        r"\blt\b": "<",
-        r"\ble\b": "<=",
-        r"\band\b": "AND",
-        r"\bor\b": "OR",
-        r"\btrue\b": "TRUE",
-        r"\bfalse\b": "FALSE",
-        r"\bnull\b": "NULL",
-    }
-
-    for pattern, repl in replacements.items():
-        expr = re.sub(pattern, f" {repl} ", expr, flags=re.IGNORECASE)
+    # Rewrite every OData keyword in a single scan of the expression.
+    expr = _OPS_RE.sub(lambda m: f" {_SQL_MAP[m.group(1).lower()]} ", filter_expr)
 
     # Normalize whitespace a bit
-    expr = re.sub(r"\s+", " ", expr).strip()
+    expr = _WS_RE.sub(" ", expr).strip()
     return expr
 
 
+@functools.lru_cache(maxsize=512)
+def extract_filter_columns(filter_expr: str) -> frozenset:
+    """
+    Column names referenced by a $filter expression: every bare identifier
+    that is not an OData keyword, with quoted literals stripped first.
+    Used by the router to validate filters against the configured
+    filterable columns before any SQL is built.
+    """
+    stripped = _QUOTED_RE.sub("", filter_expr)
+    return frozenset(
+        token
+        for token in _IDENT_RE.findall(stripped)
+        if token.lower() not in _SQL_MAP
+    )
+
+
 def build_where_clause(filter_expr: Optional[str]) -> Tuple[Optional[str], List[object]]:
     """
     Convert an OData-style $filter expression into a SQL WHERE clause fragment.
@@ -68,6 +91,8 @@ def build_where_clause(filter_expr: Optional[str]) -> Tuple[Optional[str], List[
     try:
         sql = _translate_odata_to_sql(filter_expr)
         logger.info("Translated $filter to SQL: %s -> %s", filter_expr, sql)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Filter translation cache: %s", _translate_odata_to_sql.cache_info())
         return sql, []
     except Exception as e:
         logger.warning(
@@ -1,15 +1,31 @@
 # src/engine/odata/registry.py
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Tuple
+import sys
 from dataclasses import dataclass, field
+import mmap
 import os
 import json
 import threading
 
 import duckdb
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; stdlib json accepts the same bytes input.
+    orjson = json  # type: ignore[assignment]
+
+try:
+    # libyaml-backed loader is ~10x faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 import logging
 
@@ -22,12 +38,51 @@ logger = logging.getLogger(__name__)
 _DUCKDB_CONN = duckdb.connect(database=":memory:")
 _DUCKDB_LOCK = threading.Lock()
 
+# Metadata files larger than this are mmap'd rather than read into memory.
+_MMAP_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Skip Pydantic validation for metadata that was already validated upstream
+# (the DataProduct CRD schema / operator). The first item of every load is
+# still fully validated as a sanity check.
+_TRUSTED_CONFIG = os.getenv("DP_TRUSTED_CONFIG", "false").lower() == "true"
+
+# Sources that point at the same parquet file (same resolved path, mtime,
+# rename map and materialization kind) share one DuckDB relation instead of
+# each product creating its own. Cleared at the start of every registry
+# rebuild so entries never outlive the files they describe. Only touched
+# while _LOAD_LOCK is held.
+# key: (path, mtime_ns, rename items, cache) -> relation name
+_SOURCE_RELATION_CACHE: Dict[tuple, str] = {}
+
+# Serializes entire load/reload passes. _REGISTRY_LOCK only guards the
+# final publish; without this, two overlapping reloads would interleave
+# their _SOURCE_RELATION_CACHE clears and per-product builds.
+_LOAD_LOCK = threading.Lock()
+
 
 def _quote_ident(name: str) -> str:
     # Minimal identifier quoting for DuckDB
     return '"' + str(name).replace('"', '""') + '"'
 
 
+def _drop_relation_if_exists(name: str) -> None:
+    """
+    Drop a view or table of the given name, whichever currently exists.
+
+    DuckDB's DROP statements raise on a relation-kind mismatch even with
+    IF EXISTS, so the catalog is consulted first. Callers must hold
+    _DUCKDB_LOCK.
+    """
+    row = _DUCKDB_CONN.execute(
+        "SELECT table_type FROM information_schema.tables WHERE table_name = ?",
+        [name],
+    ).fetchone()
+    if row is None:
+        return
+    kind = "VIEW" if row[0] == "VIEW" else "TABLE"
+    _DUCKDB_CONN.execute(f"DROP {kind} {_quote_ident(name)}")
+
+
 # ------------------------------------------------------------
 # Pydantic configuration models
 # ------------------------------------------------------------
@@ -35,6 +90,10 @@ def _quote_ident(name: str) -> str:
 class SourceConfig(BaseModel):
     path: str
     rename: Dict[str, str] = Field(default_factory=dict)
+    # Materialize the source as an in-memory DuckDB table instead of a
+    # view over read_parquet, so queries skip the Parquet decode. Opt-in:
+    # only sensible for small/medium hot sources.
+    cache: bool = False
 
 
 class JoinConfig(BaseModel):
@@ -97,7 +156,7 @@ class DataProductConfig(BaseModel):
     qos: Dict[str, Any] = Field(default_factory=dict)
     deployment_mode: Optional[str] = None
 
-    @property
+    @cached_property
     def route_key(self) -> str:
         """
         Canonical route key used by the engine/registry.
@@ -117,6 +176,18 @@ class DataProductConfig(BaseModel):
         return r.lstrip("/")
 
 
+# Built once: TypeAdapters are expensive to instantiate but cheap to reuse,
+# so every load path shares these instead of going through model __init__.
+# _DP_LIST_ADAPTER validates a whole dataproducts.json list inside
+# pydantic-core's JSON parser, with no intermediate list of dicts.
+_DP_LIST_ADAPTER = TypeAdapter(List[DataProductConfig])
+_DP_ADAPTER = TypeAdapter(DataProductConfig)
+_API_ADAPTER = TypeAdapter(APISpec)
+_BACKEND_ADAPTER = TypeAdapter(BackendConfig)
+_ENTITY_ADAPTER = TypeAdapter(EntityConfig)
+_ODATA_ADAPTER = TypeAdapter(ODataConfig)
+
+
 # ------------------------------------------------------------
 # Runtime model (no in-memory DataFrame)
 # ------------------------------------------------------------
@@ -126,6 +197,18 @@ class DataProductRuntime:
     config: DataProductConfig
     joined_view: str                      # e.g., "dp_southafrica_scheduled_outage_joined"
     source_views: Dict[str, str] = field(default_factory=dict)
+    # Column names declared in the entity config; used to validate
+    # $select/$orderby identifiers in O(1) before they reach SQL.
+    allowed_columns: frozenset = frozenset()
+    # Actual columns of each source view, keyed by source name.
+    source_columns: Dict[str, frozenset] = field(default_factory=dict)
+    # (default_top, max_top) with sys.maxsize standing in for "no max",
+    # precomputed so the per-request clamp is a tuple unpack + min().
+    odata_limits: Tuple[Optional[int], int] = (None, sys.maxsize)
+    # odata.filterable / odata.orderable promoted to frozensets so
+    # membership tests are O(1) instead of list scans. Empty = unrestricted.
+    filterable_set: frozenset = frozenset()
+    orderable_set: frozenset = frozenset()
 
 
 # ------------------------------------------------------------
@@ -133,9 +216,24 @@ class DataProductRuntime:
 # ------------------------------------------------------------
 
 # key = route_key
+#
+# Copy-on-write: readers (get_runtime/list_products, called per request)
+# access _REGISTRY without locking. Writers build a fresh dict off to the
+# side and publish it with a single attribute assignment, which is atomic
+# under the GIL — readers observe either the old or the new registry,
+# never a partially-populated one. _REGISTRY_LOCK only serializes writers.
 _REGISTRY: Dict[str, DataProductRuntime] = {}
 _REGISTRY_LOCK = threading.Lock()
 
+# Bumped on every registry publish. Downstream caches (e.g. the router's
+# result cache) embed the generation in their keys, so a reload implicitly
+# invalidates them without any cross-module coupling.
+_REGISTRY_GENERATION = 0
+
+
+def get_generation() -> int:
+    return _REGISTRY_GENERATION
+
 
 # ------------------------------------------------------------
 # Helper to determine repo_root
@@ -165,21 +263,42 @@ def load_config_dir(config_dir: Path) -> None:
     DataProduct CR is the source of truth, but this function is kept as a
     convenient fallback.
     """
-    global _REGISTRY
-    with _REGISTRY_LOCK:
-        _REGISTRY.clear()
+    with _LOAD_LOCK:
+        _load_config_dir_locked(config_dir)
 
-    for path in config_dir.glob("*.yaml"):
-        with path.open("r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
 
-        cfg = DataProductConfig(**raw)
+def _load_config_dir_locked(config_dir: Path) -> None:
+    global _REGISTRY, _REGISTRY_GENERATION
+
+    def _read_one(path: Path) -> dict:
+        # Bytes in, so libyaml's C parser handles UTF-8 decoding itself.
+        return yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+    paths = sorted(config_dir.glob("*.yaml"))
+
+    # Stage 1: read + parse YAML in parallel (libyaml releases the GIL
+    # during parsing, and the reads overlap I/O latency).
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            raws = list(ex.map(_read_one, paths))
+    else:
+        raws = [_read_one(p) for p in paths]
+
+    # Stage 2: validate and build runtimes sequentially so registry
+    # construction and DuckDB DDL stay single-threaded.
+    _SOURCE_RELATION_CACHE.clear()
+    new_registry: Dict[str, DataProductRuntime] = {}
+    for raw in raws:
+        cfg = DataProductConfig.model_validate(raw)
         repo_root = config_dir.parent.parent
         runtime = build_runtime(cfg, repo_root)
         route = cfg.route_key
-        with _REGISTRY_LOCK:
-            _REGISTRY[route] = runtime
-        print(f"[config] Loaded YAML config {cfg.id} (route={route})")
+        new_registry[route] = runtime
+        logger.info("Loaded YAML config %s (route=%s)", cfg.id, route)
+
+    with _REGISTRY_LOCK:
+        _REGISTRY = new_registry
+        _REGISTRY_GENERATION += 1
 
 
 # ------------------------------------------------------------
@@ -188,24 +307,94 @@ def load_config_dir(config_dir: Path) -> None:
 
 def load_from_metadata_file(metadata_path: Path, repo_root: Optional[Path] = None) -> None:
     """
-    Load data products from a JSON metadata file (dataproducts.json).
-    Used when the ConfigMap is mounted as a file in the pod.
+    Load data products from JSON metadata.
+
+    The path is either a single dataproducts.json array (legacy ConfigMap
+    key) or a directory of one-object-per-product *.json files (the
+    per-product-key ConfigMap layout, mounted as a directory). The
+    directory form also tolerates an aggregate array file during
+    migration.
     """
-    global _REGISTRY
+    with _LOAD_LOCK:
+        _load_from_metadata_file_locked(metadata_path, repo_root)
+
+
+def _load_from_metadata_file_locked(
+    metadata_path: Path, repo_root: Optional[Path]
+) -> None:
+    global _REGISTRY, _REGISTRY_GENERATION
+
+    if metadata_path.is_dir():
+        # Aggregate (array) files load first so the per-product keys win in
+        # the registry's last-wins merge: during migration a stale
+        # dataproducts.json must never override a fresh <name>.json.
+        aggregate_items: List[dict] = []
+        single_items: List[dict] = []
+        for item_path in sorted(metadata_path.glob("*.json")):
+            try:
+                parsed = orjson.loads(item_path.read_bytes())
+            except Exception as e:
+                logger.error("Invalid metadata file %s: %s", item_path, e)
+                continue
+            if isinstance(parsed, list):
+                aggregate_items.extend(parsed)
+            else:
+                single_items.append(parsed)
+        _load_from_items(
+            aggregate_items + single_items,
+            repo_root=repo_root,
+            trusted=_TRUSTED_CONFIG,
+        )
+        return
 
     if not metadata_path.exists():
-        print(f"[metadata] {metadata_path} not found, registry will be empty.")
+        logger.warning("Metadata file %s not found, registry will be empty.", metadata_path)
         with _REGISTRY_LOCK:
-            _REGISTRY.clear()
+            _REGISTRY = {}
+            _REGISTRY_GENERATION += 1
+        return
+
+    # For very large ConfigMaps, mmap the file so the parser reads the page
+    # cache directly instead of a full in-heap copy of the raw bytes.
+    if metadata_path.stat().st_size > _MMAP_THRESHOLD_BYTES:
+        with metadata_path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # stdlib json (the fallback shim) rejects memoryview, so only
+                # hand one to the real orjson — and only as an unnamed
+                # temporary: a live view would make mapped.close() raise
+                # BufferError when this block exits.
+                if orjson is not json:
+                    items = orjson.loads(memoryview(mapped))
+                else:
+                    items = orjson.loads(mapped[:])
+        _load_items_or_raise(items, repo_root)
         return
 
-    raw_text = metadata_path.read_text(encoding="utf-8")
-    items = json.loads(raw_text)
+    raw_bytes = metadata_path.read_bytes()
+
+    if not _TRUSTED_CONFIG:
+        # Fast path: pydantic-core parses and validates the whole list in
+        # one pass, with no intermediate list-of-dicts.
+        try:
+            configs = _DP_LIST_ADAPTER.validate_json(raw_bytes)
+        except ValidationError as e:
+            logger.warning(
+                "Bulk validation of %s failed (%d errors); "
+                "falling back to per-item loading.",
+                metadata_path,
+                e.error_count(),
+            )
+        else:
+            _register_configs(configs, repo_root)
+            return
+
+    _load_items_or_raise(orjson.loads(raw_bytes), repo_root)
+
 
+def _load_items_or_raise(items: Any, repo_root: Optional[Path]) -> None:
     if not isinstance(items, list):
         raise ValueError("dataproducts.json must contain a JSON array of data products")
-
-    _load_from_items(items, repo_root=repo_root)
+    _load_from_items(items, repo_root=repo_root, trusted=_TRUSTED_CONFIG)
 
 
 # ------------------------------------------------------------
@@ -213,12 +402,17 @@ def load_from_metadata_file(metadata_path: Path, repo_root: Optional[Path] = Non
 # ------------------------------------------------------------
 
 def load_from_cr_manifest(cr_path: Path, repo_root: Optional[Path] = None) -> None:
-    global _REGISTRY
+    with _LOAD_LOCK:
+        _load_from_cr_manifest_locked(cr_path, repo_root)
+
+
+def _load_from_cr_manifest_locked(cr_path: Path, repo_root: Optional[Path]) -> None:
+    global _REGISTRY, _REGISTRY_GENERATION
 
     if not cr_path.exists():
         raise FileNotFoundError(f"DataProduct CR manifest not found: {cr_path}")
 
-    raw = yaml.safe_load(cr_path.read_text(encoding="utf-8"))
+    raw = yaml.load(cr_path.read_bytes(), Loader=_YamlLoader)
     spec = raw.get("spec", {})
 
     dp_id = raw["metadata"]["name"]
@@ -229,51 +423,133 @@ def load_from_cr_manifest(cr_path: Path, repo_root: Optional[Path] = None) -> No
 
     cfg = DataProductConfig(
         id=dp_id,
-        api=APISpec(
-            path=api.get("path", f"/{dp_id}"),
-            protocol=api.get("protocol", "odata"),
-            resource=api.get("resource"),
-            version=api.get("version", "v1"),
+        api=_API_ADAPTER.validate_python(
+            {
+                "path": api.get("path", f"/{dp_id}"),
+                "protocol": api.get("protocol", "odata"),
+                "resource": api.get("resource"),
+                "version": api.get("version", "v1"),
+            }
         ),
         description=spec.get("description"),
-        backend=BackendConfig(**backend),
-        entity=EntityConfig(**entity),
-        odata=ODataConfig(**odata),
+        backend=_BACKEND_ADAPTER.validate_python(backend),
+        entity=_ENTITY_ADAPTER.validate_python(entity),
+        odata=_ODATA_ADAPTER.validate_python(odata),
     )
 
     repo_root_resolved = _resolve_repo_root(repo_root)
+    _SOURCE_RELATION_CACHE.clear()
     runtime = build_runtime(cfg, repo_root_resolved)
 
     with _REGISTRY_LOCK:
-        _REGISTRY.clear()
-        _REGISTRY[cfg.route_key] = runtime
+        _REGISTRY = {cfg.route_key: runtime}
+        _REGISTRY_GENERATION += 1
 
-    print(f"[local] Loaded DataProduct CR from {cr_path} (id={cfg.id}, route={cfg.route_key})")
+    logger.info(
+        "Loaded DataProduct CR from %s (id=%s, route=%s)", cr_path, cfg.id, cfg.route_key
+    )
+
+
+# ------------------------------------------------------------
+# Internal helper: construct a config without validation (trusted data)
+# ------------------------------------------------------------
+
+def _construct_config(raw: dict) -> DataProductConfig:
+    """
+    Build a DataProductConfig via model_construct, skipping validation.
+
+    Only for trusted, already-validated metadata (CRs admitted through the
+    CRD schema); model_construct is 10-50x cheaper than model_validate but
+    performs no checking at all.
+    """
+    backend = raw["backend"]
+    entity = raw["entity"]
+    api = raw.get("api")
+    odata = raw.get("odata") or {}
+    security = raw.get("security") or {}
+
+    return DataProductConfig.model_construct(
+        id=raw["id"],
+        route=raw.get("route"),
+        api=APISpec.model_construct(**api) if api else None,
+        description=raw.get("description"),
+        namespace=raw.get("namespace"),
+        display_name=raw.get("display_name"),
+        owner=raw.get("owner"),
+        backend=BackendConfig.model_construct(
+            engine=backend["engine"],
+            sources={
+                name: SourceConfig.model_construct(**src)
+                for name, src in backend["sources"].items()
+            },
+            joins=[
+                JoinConfig.model_construct(**j) for j in backend.get("joins", [])
+            ],
+        ),
+        entity=EntityConfig.model_construct(
+            name=entity["name"],
+            key_column=entity["key_column"],
+            columns=[
+                EntityColumn.model_construct(**c) for c in entity["columns"]
+            ],
+        ),
+        odata=ODataConfig.model_construct(**odata),
+        security=SecurityConfig.model_construct(**security),
+        qos=raw.get("qos", {}),
+        deployment_mode=raw.get("deployment_mode"),
+    )
 
 
 # ------------------------------------------------------------
 # Internal helper: populate registry from a list of metadata dicts
 # ------------------------------------------------------------
 
-def _load_from_items(items: List[dict], repo_root: Optional[Path] = None) -> None:
+def _load_from_items(
+    items: List[dict],
+    repo_root: Optional[Path] = None,
+    trusted: bool = False,
+) -> None:
     """
     Load a list of data product configs into the in-memory registry.
 
     Any item that fails due to validation errors or missing data files is
     logged and skipped instead of crashing the whole engine.
-    """
-    global _REGISTRY
-    repo_root_resolved = Path(repo_root) if repo_root else Path(".")
-
-    new_registry: Dict[str, DataProductRuntime] = {}
 
-    for raw in items:
+    With trusted=True, items after the first are built via model_construct
+    (no validation); the first item is always fully validated as a sanity
+    check on the metadata source.
+    """
+    configs: List[DataProductConfig] = []
+    for index, raw in enumerate(items):
         try:
-            cfg = DataProductConfig(**raw)
+            if trusted and index > 0:
+                cfg = _construct_config(raw)
+            else:
+                cfg = _DP_ADAPTER.validate_python(raw)
         except Exception as e:
             logger.error("Invalid data product config %r: %s", raw.get("id"), e)
             continue
+        configs.append(cfg)
 
+    _register_configs(configs, repo_root)
+
+
+def _register_configs(
+    configs: List[DataProductConfig], repo_root: Optional[Path]
+) -> None:
+    """
+    Build runtimes for already-validated configs and publish the registry.
+
+    Items whose data files are missing or whose runtime fails to build are
+    logged and skipped instead of crashing the whole engine.
+    """
+    global _REGISTRY, _REGISTRY_GENERATION
+    repo_root_resolved = Path(repo_root) if repo_root else Path(".")
+
+    _SOURCE_RELATION_CACHE.clear()
+    new_registry: Dict[str, DataProductRuntime] = {}
+
+    for cfg in configs:
         try:
             runtime = build_runtime(cfg, repo_root_resolved)
         except FileNotFoundError as e:
@@ -296,6 +572,7 @@ def _load_from_items(items: List[dict], repo_root: Optional[Path] = None) -> Non
 
     with _REGISTRY_LOCK:
         _REGISTRY = new_registry
+        _REGISTRY_GENERATION += 1
 
     logger.info("Loaded %d data products into registry.", len(_REGISTRY))
 
@@ -313,74 +590,223 @@ def build_runtime(cfg: DataProductConfig, repo_root: Path) -> DataProductRuntime
     dp_id = cfg.id
     base_view_prefix = f"dp_{dp_id.replace('-', '_')}"
     source_views: Dict[str, str] = {}
+    source_columns: Dict[str, frozenset] = {}
 
     with _DUCKDB_LOCK:
-        # 1. Create a view per source
-        for name, src in backend.sources.items():
-            view_name = f"{base_view_prefix}_{name}"
-            full_path = (repo_root / src.path).resolve()
-
-            if not full_path.exists():
-                raise FileNotFoundError(f"Parquet not found for source '{name}': {full_path}")
-
-            if src.rename:
-                select_cols = [
-                    f"{_quote_ident(orig)} AS {_quote_ident(new)}"
-                    for orig, new in src.rename.items()
-                ]
-                select_clause = ", ".join(select_cols)
-            else:
-                select_clause = "*"
-
-            sql = f"""
-                CREATE OR REPLACE VIEW {_quote_ident(view_name)} AS
-                SELECT {select_clause}
-                FROM read_parquet('{full_path}');
-            """
-            logger.info("Creating source view for %s: %s", name, sql)
-            _DUCKDB_CONN.execute(sql)
-            source_views[name] = view_name
-
-        # 2. Create joined view
-        if backend.joins:
-            first_join = backend.joins[0]
-            if first_join.left not in source_views:
-                raise ValueError(f"Unknown join base source '{first_join.left}'")
-
-            joined_view = f"{base_view_prefix}_joined"
-
-            # For now: single join chain, similar to previous pandas implementation
-            # (we use only first join as pattern; more can be added later)
-            join = backend.joins[0]
-            left_view = source_views[join.left]
-            right_view = source_views[join.right]
-
-            if not join.on:
-                raise ValueError(
-                    f"Join between '{join.left}' and '{join.right}' has no 'on:' columns configured"
-                )
+        # All DDL for one product runs in a single transaction: one commit
+        # instead of one per statement, and a failed build rolls back
+        # cleanly rather than leaving a half-created set of views.
+        # Snapshot the shared-relation cache so entries registered by a
+        # rolled-back build don't outlive the relations they point at.
+        cache_snapshot = dict(_SOURCE_RELATION_CACHE)
+        _DUCKDB_CONN.begin()
+        try:
+            joined_view = _create_product_relations(
+                cfg, repo_root, base_view_prefix, source_views, source_columns
+            )
+            _DUCKDB_CONN.commit()
+        except Exception:
+            _DUCKDB_CONN.rollback()
+            _SOURCE_RELATION_CACHE.clear()
+            _SOURCE_RELATION_CACHE.update(cache_snapshot)
+            raise
+
+    odata_cfg = cfg.odata
+    max_top = odata_cfg.max_top if odata_cfg.max_top is not None else sys.maxsize
+
+    return DataProductRuntime(
+        config=cfg,
+        joined_view=joined_view,
+        source_views=source_views,
+        allowed_columns=frozenset(c.name for c in cfg.entity.columns),
+        source_columns=source_columns,
+        odata_limits=(odata_cfg.default_top, max_top),
+        filterable_set=frozenset(odata_cfg.filterable),
+        orderable_set=frozenset(odata_cfg.orderable),
+    )
+
+
+def _index_filterable_columns(table_name: str, cfg: DataProductConfig) -> None:
+    """
+    Create ART indexes on a materialized table for the product's declared
+    filterable columns, turning equality filters into index probes instead
+    of full scans. Views can't be indexed, so this only runs for cached
+    relations. Callers must hold _DUCKDB_LOCK.
+    """
+    table_cols = {
+        row[0]
+        for row in _DUCKDB_CONN.execute(
+            f"DESCRIBE {_quote_ident(table_name)}"
+        ).fetchall()
+    }
+    for col in cfg.odata.filterable:
+        if col not in table_cols:
+            continue
+        index_name = f"idx_{table_name}_{col}"
+        _DUCKDB_CONN.execute(
+            f"CREATE INDEX IF NOT EXISTS {_quote_ident(index_name)} "
+            f"ON {_quote_ident(table_name)} ({_quote_ident(col)})"
+        )
+
+
+def _create_product_relations(
+    cfg: DataProductConfig,
+    repo_root: Path,
+    base_view_prefix: str,
+    source_views: Dict[str, str],
+    source_columns: Dict[str, frozenset],
+) -> str:
+    """
+    Create the per-source and joined relations for a product inside the
+    caller's transaction, returning the joined relation name. Callers must
+    hold _DUCKDB_LOCK.
+    """
+    backend = cfg.backend
 
-            on_clause = " AND ".join(
-                f"L.{_quote_ident(col)} = R.{_quote_ident(col)}" for col in join.on
+    # Resolve the root once; per-source paths are plain joins after this,
+    # avoiding a realpath (one stat per path component) for every source.
+    repo_root = repo_root.resolve()
+
+    # 1. Create a view per source
+    for name, src in backend.sources.items():
+        view_name = f"{base_view_prefix}_{name}"
+        full_path = repo_root / src.path
+
+        if not full_path.exists():
+            raise FileNotFoundError(f"Parquet not found for source '{name}': {full_path}")
+
+        cache_key = (
+            str(full_path),
+            full_path.stat().st_mtime_ns,
+            tuple(sorted(src.rename.items())),
+            src.cache,
+        )
+        shared = _SOURCE_RELATION_CACHE.get(cache_key)
+        if shared is not None:
+            logger.info(
+                "Source %s of %s reuses shared relation %s", name, cfg.id, shared
+            )
+            source_views[name] = shared
+            source_columns[name] = frozenset(
+                row[0]
+                for row in _DUCKDB_CONN.execute(
+                    f"DESCRIBE {_quote_ident(shared)}"
+                ).fetchall()
             )
+            continue
 
-            sql_joined = f"""
-                CREATE OR REPLACE VIEW {_quote_ident(joined_view)} AS
-                SELECT L.*, R.*
-                FROM {_quote_ident(left_view)} AS L
-                JOIN {_quote_ident(right_view)} AS R
-                  ON {on_clause};
-            """
-            logger.info("Creating joined view for %s: %s", cfg.id, sql_joined)
-            _DUCKDB_CONN.execute(sql_joined)
+        if src.rename:
+            # SELECT * RENAME keeps every other column instead of silently
+            # projecting the parquet down to just the renamed ones, and
+            # still lets DuckDB push projections through the view.
+            rename_clause = ", ".join(
+                f"{_quote_ident(orig)} AS {_quote_ident(new)}"
+                for orig, new in src.rename.items()
+            )
+            select_clause = f"* RENAME ({rename_clause})"
         else:
-            # No joins: expect a single source
-            if len(source_views) != 1:
-                raise ValueError("Multiple sources provided but no joins defined.")
-            # Pick the single source as the joined_view
-            joined_view = next(iter(source_views.values()))
+            select_clause = "*"
+
+        relation_kind = "TABLE" if src.cache else "VIEW"
+        # A reload may flip `cache`; CREATE OR REPLACE cannot change the
+        # relation kind, so drop whatever exists under this name first.
+        _drop_relation_if_exists(view_name)
+        sql = f"""
+            CREATE OR REPLACE {relation_kind} {_quote_ident(view_name)} AS
+            SELECT {select_clause}
+            FROM read_parquet('{full_path}');
+        """
+        logger.info("Creating source %s for %s: %s", relation_kind.lower(), name, sql)
+        _DUCKDB_CONN.execute(sql)
+        _SOURCE_RELATION_CACHE[cache_key] = view_name
+        source_views[name] = view_name
+        if src.cache:
+            _index_filterable_columns(view_name, cfg)
+        source_columns[name] = frozenset(
+            row[0]
+            for row in _DUCKDB_CONN.execute(
+                f"DESCRIBE {_quote_ident(view_name)}"
+            ).fetchall()
+        )
+
+    # 2. Create joined view
+    if backend.joins:
+        first_join = backend.joins[0]
+        if first_join.left not in source_views:
+            raise ValueError(f"Unknown join base source '{first_join.left}'")
+
+        joined_view = f"{base_view_prefix}_joined"
+
+        # For now: single join chain, similar to previous pandas implementation
+        # (we use only first join as pattern; more can be added later)
+        join = backend.joins[0]
+        left_view = source_views[join.left]
+        right_view = source_views[join.right]
+
+        if not join.on:
+            raise ValueError(
+                f"Join between '{join.left}' and '{join.right}' has no 'on:' columns configured"
+            )
 
-    return DataProductRuntime(config=cfg, joined_view=joined_view, source_views=source_views)
+        on_clause = " AND ".join(
+            f"L.{_quote_ident(col)} = R.{_quote_ident(col)}" for col in join.on
+        )
+
+        # Project the join down to the columns the entity declares, resolving
+        # each against its originating side (left wins on ties). This lets
+        # DuckDB's Parquet reader prune everything else from disk and avoids
+        # duplicate join-key columns from L.*, R.*. If any declared column
+        # cannot be located, fall back to the permissive wildcard join.
+        left_cols = source_columns[join.left]
+        right_cols = source_columns[join.right]
+        select_parts: List[str] = []
+        for col in cfg.entity.columns:
+            if col.generated:
+                continue
+            if col.name in left_cols:
+                select_parts.append(f"L.{_quote_ident(col.name)}")
+            elif col.name in right_cols:
+                select_parts.append(f"R.{_quote_ident(col.name)}")
+            else:
+                logger.warning(
+                    "Entity column %r of %s not found in joined sources; "
+                    "falling back to SELECT L.*, R.*",
+                    col.name,
+                    cfg.id,
+                )
+                select_parts = []
+                break
+        if select_parts:
+            joined_select = ", ".join(select_parts)
+        else:
+            # Wildcard fallback: exclude the join keys from the right side
+            # so they don't come back duplicated as "<col>_1".
+            exclude = ", ".join(_quote_ident(col) for col in join.on)
+            joined_select = f"L.*, R.* EXCLUDE ({exclude})"
+
+        # When every source is materialized, materialize the join too so
+        # repeat queries skip the join entirely.
+        joined_kind = "TABLE" if all(s.cache for s in backend.sources.values()) else "VIEW"
+        _drop_relation_if_exists(joined_view)
+        sql_joined = f"""
+            CREATE OR REPLACE {joined_kind} {_quote_ident(joined_view)} AS
+            SELECT {joined_select}
+            FROM {_quote_ident(left_view)} AS L
+            JOIN {_quote_ident(right_view)} AS R
+              ON {on_clause};
+        """
+        logger.info("Creating joined view for %s: %s", cfg.id, sql_joined)
+        _DUCKDB_CONN.execute(sql_joined)
+        if joined_kind == "TABLE":
+            _index_filterable_columns(joined_view, cfg)
+    else:
+        # No joins: expect a single source
+        if len(source_views) != 1:
+            raise ValueError("Multiple sources provided but no joins defined.")
+        # Pick the single source as the joined_view
+        joined_view = next(iter(source_views.values()))
+
+    return joined_view
 
 
 # ------------------------------------------------------------
@@ -388,14 +814,18 @@ def build_runtime(cfg: DataProductConfig, repo_root: Path) -> DataProductRuntime
 # ------------------------------------------------------------
 
 def get_runtime(route: str) -> Optional[DataProductRuntime]:
-    key = route.lstrip("/")
-    with _REGISTRY_LOCK:
-        return _REGISTRY.get(key)
+    # Lock-free read; see the copy-on-write note on _REGISTRY.
+    # Registry keys are stored pre-stripped, so the common case (no
+    # leading slash) is a single dict lookup with no string work.
+    runtime = _REGISTRY.get(route)
+    if runtime is not None:
+        return runtime
+    return _REGISTRY.get(route.lstrip("/"))
 
 
 def list_products() -> List[DataProductRuntime]:
-    with _REGISTRY_LOCK:
-        return list(_REGISTRY.values())
+    # Lock-free read; see the copy-on-write note on _REGISTRY.
+    return list(_REGISTRY.values())
 
 
 def get_duckdb_connection():
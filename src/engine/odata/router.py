@@ -1,53 +1,141 @@
 # src/engine/odata/router.py
 
 from typing import Optional, List, Tuple
-import json
+from collections import OrderedDict
+import functools
+import hashlib
 import logging
+import re
+import threading
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+import orjson
+import pyarrow as pa
+
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
 from fastapi.responses import StreamingResponse
 
 from .registry import (
     list_products,
     get_runtime,
     get_duckdb_connection,
+    get_generation,
 )
-from .filter import build_where_clause
+from .filter import build_where_clause, extract_filter_columns
 
 from ..security.dependency import get_current_principal
 from ..security.authorization import check_dataset_access
 
 logger = logging.getLogger(__name__)
 
-# Obtain shared DuckDB connection & lock
+# Shared DuckDB connection. Query paths do NOT take the DDL lock: each
+# request runs on its own cursor (an isolated connection onto the same
+# database), so concurrent queries overlap instead of serializing on a
+# process-wide mutex. The lock is only held by the registry during DDL.
 _DUCKDB_CONN, _DUCKDB_LOCK = get_duckdb_connection()
 
 
+def _cursor():
+    return _DUCKDB_CONN.cursor()
+
+
+# Streaming responses are coalesced into chunks of roughly this size before
+# crossing the ASGI boundary, instead of yielding one micro-string per row.
+_STREAM_BUF_LIMIT = 64 * 1024
+
+# Small LRU over complete non-streaming response bodies. Keys embed the
+# registry generation, so every reload implicitly invalidates all entries.
+_RESULT_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_RESULT_CACHE_MAX = 128
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+_AND_SPLIT_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_OR_OR_PARENS_RE = re.compile(r"\(|\)|\bor\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_filter(filter_: Optional[str]) -> Optional[str]:
+    """
+    Canonicalize a $filter for cache keying: AND-clauses are
+    order-insensitive, so sort them. Expressions with OR or parentheses
+    are left untouched — reordering there would change semantics.
+    """
+    if not filter_:
+        return filter_
+    if _OR_OR_PARENS_RE.search(filter_):
+        return filter_.strip()
+    clauses = [c.strip() for c in _AND_SPLIT_RE.split(filter_)]
+    if any(c.count("'") % 2 for c in clauses):
+        # A quoted literal spans an "and": splitting broke the string
+        # apart, so reordering could conflate distinct filters.
+        return filter_.strip()
+    return " and ".join(sorted(clauses))
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_select(select: Optional[str]) -> Optional[str]:
+    """
+    Canonicalize a $select: the projected set is what matters, not the
+    order it was written in.
+    """
+    if not select:
+        return select
+    return ",".join(sorted(c.strip() for c in select.split(",") if c.strip()))
+
+
+def _cache_key_digest(key: tuple) -> str:
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def _result_cache_get(key: tuple) -> Optional[dict]:
+    with _RESULT_CACHE_LOCK:
+        body = _RESULT_CACHE.get(key)
+        if body is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return body
+
+
+def _result_cache_put(key: tuple, body: dict) -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = body
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
+
 # ------------------------------------------------------------------
 # Helpers for OData-style paging / limits
 # ------------------------------------------------------------------
 def _effective_top(requested_top: Optional[int], runtime) -> Optional[int]:
     """
-    Apply default_top and max_top from config.odata if present.
+    Apply default_top and max_top, precomputed on the runtime at build time.
     """
-    odata_cfg = getattr(runtime.config, "odata", None)
-
-    top = requested_top
-
-    # default_top if nothing requested
-    if top is None and odata_cfg is not None:
-        default_top = getattr(odata_cfg, "default_top", None)
-        if default_top is not None:
-            top = default_top
+    default_top, max_top = runtime.odata_limits
+    top = requested_top if requested_top is not None else default_top
+    return None if top is None else min(top, max_top)
 
-    # clamp to max_top
-    if odata_cfg is not None and top is not None:
-        max_top = getattr(odata_cfg, "max_top", None)
-        if max_top is not None and top > max_top:
-            top = max_top
 
-    return top
+@functools.lru_cache(maxsize=512)
+def _static_query_string(
+    select: Optional[str],
+    filter_: Optional[str],
+    orderby: Optional[str],
+) -> str:
+    """
+    Encode the paging-invariant query params ($select/$filter/$orderby)
+    once; every nextLink for the same query reuses the encoded tail.
+    """
+    params = [
+        (key, value)
+        for key, value in (
+            ("$select", select),
+            ("$filter", filter_),
+            ("$orderby", orderby),
+        )
+        if value
+    ]
+    return urlencode(params)
 
 
 def _build_next_link_base(
@@ -61,40 +149,60 @@ def _build_next_link_base(
     """
     Build an OData-style @odata.nextLink URL with the same query params plus new $skip/$top.
     """
-    params = {
-        "$skip": next_skip,
-        "$top": top,
-    }
-    if select:
-        params["$select"] = select
-    if filter_:
-        params["$filter"] = filter_
-    if orderby:
-        params["$orderby"] = orderby
-
-    return f"{base_path}?{urlencode(params)}"
+    static_qs = _static_query_string(select, filter_, orderby)
+    tail = f"&{static_qs}" if static_qs else ""
+    return f"{base_path}?$skip={next_skip}&$top={top}{tail}"
 
 
-def _build_select_list(select: Optional[str]) -> str:
+@functools.lru_cache(maxsize=512)
+def _build_select_list(select: Optional[str], allowed: Optional[frozenset] = None) -> str:
     if not select:
         return "*"
     cols = [c.strip() for c in select.split(",") if c.strip()]
     if not cols:
         return "*"
+    if allowed is not None:
+        for c in cols:
+            if c not in allowed:
+                raise HTTPException(status_code=400, detail=f"Unknown $select column '{c}'")
     return ", ".join(f'"{c}"' for c in cols)
 
 
-def _build_order_by(orderby: Optional[str]) -> str:
+@functools.lru_cache(maxsize=512)
+def _build_order_by(orderby: Optional[str], allowed: Optional[frozenset] = None) -> str:
     if not orderby:
         return ""
-    # For now, expect clauses like "col" or "col desc"
+    # Expect clauses like "col" or "col desc" / "col asc"
     items = [i.strip() for i in orderby.split(",") if i.strip()]
     if not items:
         return ""
-    # TODO: add identifier quoting if needed
-    return " ORDER BY " + ", ".join(items)
+    clauses = []
+    for item in items:
+        parts = item.split()
+        col = parts[0]
+        direction = parts[1].lower() if len(parts) > 1 else "asc"
+        if len(parts) > 2 or direction not in ("asc", "desc"):
+            raise HTTPException(status_code=400, detail=f"Invalid $orderby clause '{item}'")
+        if allowed is not None and col not in allowed:
+            raise HTTPException(status_code=400, detail=f"Unknown $orderby column '{col}'")
+        clauses.append(f'"{col}" {direction.upper()}')
+    return " ORDER BY " + ", ".join(clauses)
+
+
+def _validate_filter_columns(
+    filter_: Optional[str], filterable: Optional[frozenset]
+) -> None:
+    if not filter_ or not filterable:
+        return
+    unknown = extract_filter_columns(filter_) - filterable
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown or non-filterable $filter column '{sorted(unknown)[0]}'",
+        )
 
 
+@functools.lru_cache(maxsize=1024)
 def _build_sql_for_query(
     base_view: str,
     select: Optional[str],
@@ -102,10 +210,19 @@ def _build_sql_for_query(
     orderby: Optional[str],
     top: Optional[int],
     skip: Optional[int],
-) -> Tuple[str, List[object]]:
-    select_clause = _build_select_list(select)
+    allowed: Optional[frozenset] = None,
+    include_total: bool = False,
+    orderable: Optional[frozenset] = None,
+    filterable: Optional[frozenset] = None,
+) -> Tuple[str, tuple]:
+    select_clause = _build_select_list(select, allowed)
+    if include_total:
+        # Window count: the filtered total rides along with the page in the
+        # same scan instead of a second COUNT(*) query over the filter.
+        select_clause += ', COUNT(*) OVER () AS "_odata_total"'
+    _validate_filter_columns(filter_, filterable)
     where_clause, params = build_where_clause(filter_)
-    order_clause = _build_order_by(orderby)
+    order_clause = _build_order_by(orderby, orderable if orderable else allowed)
 
     limit_clause = ""
     if top is not None:
@@ -118,15 +235,60 @@ def _build_sql_for_query(
         sql += f" WHERE {where_clause}"
     sql += order_clause + limit_clause
 
-    return sql, params
+    # Tuple so the cached value is immutable and safe to share.
+    return sql, tuple(params)
 
 
-def _build_sql_for_count(base_view: str, filter_: Optional[str]) -> Tuple[str, List[object]]:
+@functools.lru_cache(maxsize=512)
+def _build_sql_for_count(
+    base_view: str,
+    filter_: Optional[str],
+    filterable: Optional[frozenset] = None,
+) -> Tuple[str, tuple]:
+    _validate_filter_columns(filter_, filterable)
     where_clause, params = build_where_clause(filter_)
     sql = f'SELECT COUNT(*) AS cnt FROM "{base_view}"'
     if where_clause:
         sql += f" WHERE {where_clause}"
-    return sql, params
+    return sql, tuple(params)
+
+
+def _pop_total(records: List[dict]) -> Optional[int]:
+    """
+    Extract the window-aggregate total injected by include_total from the
+    fetched records, stripping the helper column from each row. Returns
+    None when the page is empty (the total never materialized).
+    """
+    if not records:
+        return None
+    total = records[0]["_odata_total"]
+    for record in records:
+        del record["_odata_total"]
+    return total
+
+
+def _compute_next_link(
+    base_path: str,
+    select: Optional[str],
+    filter_: Optional[str],
+    orderby: Optional[str],
+    skip: Optional[int],
+    eff_top: Optional[int],
+    total_count: Optional[int],
+) -> Optional[str]:
+    if total_count is None or eff_top is None:
+        return None
+    next_skip = (skip or 0) + eff_top
+    if next_skip >= total_count:
+        return None
+    return _build_next_link_base(
+        base_path=base_path,
+        select=select,
+        filter_=filter_,
+        orderby=orderby,
+        next_skip=next_skip,
+        top=eff_top,
+    )
 
 
 # ------------------------------------------------------------------
@@ -158,6 +320,8 @@ def get_metadata():
 @router.get("/{product_route}")
 def query_product(
     product_route: str,
+    request: Request,
+    response: Response,
     # OData-like query params
     select: Optional[str] = Query(default=None, alias="$select"),
     filter_: Optional[str] = Query(default=None, alias="$filter"),
@@ -166,13 +330,16 @@ def query_product(
     orderby: Optional[str] = Query(default=None, alias="$orderby"),
     count: Optional[bool] = Query(default=None, alias="$count"),
     stream: Optional[bool] = Query(default=False, alias="$stream"),
+    format_: Optional[str] = Query(default=None, alias="$format"),
     principal: Optional[dict] = Depends(get_current_principal),
 ):
     """
     Query the main (joined) dataset for a product.
 
     If $stream=true, results are returned as a StreamingResponse where the JSON
-    payload is written incrementally.
+    payload is written incrementally. With $format=arrow the page is returned
+    as an Arrow IPC stream instead of JSON, straight from DuckDB with no
+    per-row Python conversion at all.
     """
     runtime = get_runtime(product_route)
     if runtime is None:
@@ -196,16 +363,42 @@ def query_product(
     # Compute OData paging limits
     eff_top = _effective_top(top, runtime)
 
+    want_count = bool(count)
+    base_path = f"/odata/{product_route}"
+    # NDJSON negotiation: one JSON object per row, constant memory, no
+    # envelope — for bulk consumers that don't want the OData wrapper.
+    wants_ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+
+    # Unbounded pages (no $top and no configured default/max) can be a full
+    # table each; never hold those in the cache.
+    cache_key = None
+    if not stream and not wants_ndjson and format_ != "arrow" and eff_top is not None:
+        # Semantic key: AND-order and $select order don't change the result,
+        # so normalized forms share one cache entry.
+        cache_key = (
+            get_generation(), product_route, None,
+            _normalize_select(select), _normalize_filter(filter_),
+            orderby, eff_top, skip, want_count,
+        )
+        response.headers["X-ODataX-Cacheable"] = "true"
+        response.headers["X-ODataX-Cache-Key"] = _cache_key_digest(cache_key)
+        cached = _result_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     # --- total count AFTER filter, BEFORE paging (if requested) ---
+    # Streaming emits the count before any row is fetched, so it needs the
+    # separate count query; the non-streaming path fuses the count into the
+    # main scan as a window aggregate instead.
+    # Filters may only reference the configured filterable columns (falling
+    # back to the entity columns when none are declared).
+    filter_allowed = runtime.filterable_set or runtime.allowed_columns
+
     total_count = None
-    if count or count is None:
-        # OData: $count=true or absence sometimes implies count; here we opt-in if $count=true
-        if count:
-            count_sql, count_params = _build_sql_for_count(base_view, filter_)
-            with _DUCKDB_LOCK:
-                cur = _DUCKDB_CONN.execute(count_sql, count_params)
-                total_count = cur.fetchone()[0]
-                logger.info("Filtered total_count=%s for product=%s", total_count, product_route)
+    if want_count and stream:
+        count_sql, count_params = _build_sql_for_count(base_view, filter_, filter_allowed)
+        total_count = _cursor().execute(count_sql, count_params).fetchone()[0]
+        logger.info("Filtered total_count=%s for product=%s", total_count, product_route)
 
     # Build main query SQL
     sql, params = _build_sql_for_query(
@@ -215,46 +408,85 @@ def query_product(
         orderby=orderby,
         top=eff_top,
         skip=skip,
+        allowed=runtime.allowed_columns,
+        include_total=(
+            want_count and not stream and not wants_ndjson and format_ != "arrow"
+        ),
+        orderable=runtime.orderable_set,
+        filterable=filter_allowed,
     )
 
-    # Pre-compute nextLink if we have a count and a top
-    next_link = None
-    if total_count is not None and eff_top is not None:
-        current_skip = skip or 0
-        next_skip = current_skip + eff_top
-        if next_skip < total_count:
-            base_path = f"/odata/{product_route}"
-            next_link = _build_next_link_base(
-                base_path=base_path,
-                select=select,
-                filter_=filter_,
-                orderby=orderby,
-                next_skip=next_skip,
-                top=eff_top,
-            )
+    # ---------- NDJSON path ----------
+    if wants_ndjson:
+        def ndjson_iterator():
+            buf = bytearray()
+            cur = _cursor()
+            try:
+                reader = cur.execute(sql, params).fetch_record_batch(1000)
+                for batch in reader:
+                    for obj in batch.to_pylist():
+                        buf += orjson.dumps(obj, default=str)
+                        buf += b"\n"
+                        if len(buf) >= _STREAM_BUF_LIMIT:
+                            yield bytes(buf)
+                            buf.clear()
+            finally:
+                cur.close()
+            if buf:
+                yield bytes(buf)
+
+        return StreamingResponse(ndjson_iterator(), media_type="application/x-ndjson")
+
+    # ---------- Arrow IPC path ----------
+    if format_ == "arrow":
+        table = _cursor().execute(sql, params).fetch_arrow_table()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(
+            content=sink.getvalue().to_pybytes(),
+            media_type="application/vnd.apache.arrow.stream",
+        )
 
     # ---------- Non-streaming path ----------
     if not stream:
-        with _DUCKDB_LOCK:
-            cur = _DUCKDB_CONN.execute(sql, params)
-            rows = cur.fetchall()
-            columns = [d[0] for d in cur.description]
-
-        def row_to_obj(row):
-            return {col: val for col, val in zip(columns, row)}
+        # Fetch as Arrow and convert in C++: no pandas materialization
+        # and no per-row Python dict building.
+        records = _cursor().execute(sql, params).fetch_arrow_table().to_pylist()
+
+        if want_count:
+            total_count = _pop_total(records)
+            if total_count is None:
+                # Page beyond the last row: the window count never made it
+                # into the (empty) result, fall back to the count query.
+                count_sql, count_params = _build_sql_for_count(
+                    base_view, filter_, filter_allowed
+                )
+                total_count = _cursor().execute(count_sql, count_params).fetchone()[0]
+            logger.info("Filtered total_count=%s for product=%s", total_count, product_route)
+
+        next_link = _compute_next_link(
+            base_path, select, filter_, orderby, skip, eff_top, total_count
+        )
 
         body = {
             "@odata.context": f"/odata/$metadata#{product_route}",
-            "value": [row_to_obj(r) for r in rows],
+            "value": records,
         }
         if total_count is not None:
             body["@odata.count"] = total_count
         if next_link:
             body["@odata.nextLink"] = next_link
 
+        if cache_key is not None:
+            _result_cache_put(cache_key, body)
         return body
 
     # ---------- Streaming path ----------
+    next_link = _compute_next_link(
+        base_path, select, filter_, orderby, skip, eff_top, total_count
+    )
+
     def row_iterator():
         meta = {"@odata.context": f"/odata/$metadata#{product_route}"}
         if total_count is not None:
@@ -263,29 +495,34 @@ def query_product(
             meta["@odata.nextLink"] = next_link
 
         # Start JSON object and "value" array
-        head = json.dumps(meta, separators=(",", ":"))[:-1]  # strip closing '}'
-        yield head
-        yield ',"value":['
+        buf = bytearray()
+        buf += orjson.dumps(meta)[:-1]  # strip closing '}'
+        buf += b',"value":['
 
         first = True
-        with _DUCKDB_LOCK:
-            cur = _DUCKDB_CONN.execute(sql, params)
-            columns = [d[0] for d in cur.description]
-
-            while True:
-                chunk = cur.fetchmany(1000)
-                if not chunk:
-                    break
-                for row in chunk:
+        # The cursor lives for the lifetime of this generator without
+        # blocking any other request.
+        cur = _cursor()
+        try:
+            # Stream Arrow record batches: the columnar-to-records
+            # conversion happens in C++ per batch, not per row in Python.
+            reader = cur.execute(sql, params).fetch_record_batch(1000)
+            for batch in reader:
+                for obj in batch.to_pylist():
                     if not first:
-                        yield ","
+                        buf += b","
                     else:
                         first = False
-                    obj = {col: val for col, val in zip(columns, row)}
-                    yield json.dumps(obj, default=str, separators=(",", ":"))
+                    buf += orjson.dumps(obj, default=str)
+                    if len(buf) >= _STREAM_BUF_LIMIT:
+                        yield bytes(buf)
+                        buf.clear()
+        finally:
+            cur.close()
 
         # Close array and object
-        yield "]}"
+        buf += b"]}"
+        yield bytes(buf)
 
     return StreamingResponse(row_iterator(), media_type="application/json")
 
@@ -294,6 +531,7 @@ def query_product(
 def query_product_source(
     product_route: str,
     source_name: str,
+    response: Response,
     # Same OData-like query params
     select: Optional[str] = Query(default=None, alias="$select"),
     filter_: Optional[str] = Query(default=None, alias="$filter"),
@@ -334,18 +572,35 @@ def query_product_source(
     base_view = runtime.source_views[source_name]
     eff_top = _effective_top(top, runtime)
 
+    want_count = bool(count)
+    base_path = f"/odata/{product_route}/{source_name}"
+
+    cache_key = None
+    if not stream and eff_top is not None:
+        cache_key = (
+            get_generation(), product_route, source_name,
+            _normalize_select(select), _normalize_filter(filter_),
+            orderby, eff_top, skip, want_count,
+        )
+        response.headers["X-ODataX-Cacheable"] = "true"
+        response.headers["X-ODataX-Cache-Key"] = _cache_key_digest(cache_key)
+        cached = _result_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    # As in query_product: only streaming needs the separate count query.
+    filter_allowed = runtime.source_columns.get(source_name)
+
     total_count = None
-    if count:
-        count_sql, count_params = _build_sql_for_count(base_view, filter_)
-        with _DUCKDB_LOCK:
-            cur = _DUCKDB_CONN.execute(count_sql, count_params)
-            total_count = cur.fetchone()[0]
-            logger.info(
-                "Filtered total_count=%s for product=%s source=%s",
-                total_count,
-                product_route,
-                source_name,
-            )
+    if want_count and stream:
+        count_sql, count_params = _build_sql_for_count(base_view, filter_, filter_allowed)
+        total_count = _cursor().execute(count_sql, count_params).fetchone()[0]
+        logger.info(
+            "Filtered total_count=%s for product=%s source=%s",
+            total_count,
+            product_route,
+            source_name,
+        )
 
     sql, params = _build_sql_for_query(
         base_view=base_view,
@@ -354,47 +609,45 @@ def query_product_source(
         orderby=orderby,
         top=eff_top,
         skip=skip,
+        allowed=runtime.source_columns.get(source_name),
+        include_total=want_count and not stream,
+        filterable=filter_allowed,
     )
 
-    next_link = None
-    if total_count is not None and eff_top is not None:
-        current_skip = skip or 0
-        next_skip = current_skip + eff_top
-        if next_skip < total_count:
-            base_path = f"/odata/{product_route}/{source_name}"
-            next_link = _build_next_link_base(
-                base_path=base_path,
-                select=select,
-                filter_=filter_,
-                orderby=orderby,
-                next_skip=next_skip,
-                top=eff_top,
-            )
-
     # Non-streaming
     if not stream:
-        with _DUCKDB_LOCK:
-            cur = _DUCKDB_CONN.execute(sql, params)
-            rows = cur.fetchall()
-            columns = [d[0] for d in cur.description]
-
-        records = [
-            {col: val for col, val in zip(columns, row)}
-            for row in rows
-        ]
+        records = _cursor().execute(sql, params).fetch_arrow_table().to_pylist()
+
+        if want_count:
+            total_count = _pop_total(records)
+            if total_count is None:
+                count_sql, count_params = _build_sql_for_count(
+                    base_view, filter_, filter_allowed
+                )
+                total_count = _cursor().execute(count_sql, count_params).fetchone()[0]
+
+        next_link = _compute_next_link(
+            base_path, select, filter_, orderby, skip, eff_top, total_count
+        )
 
-        response = {
+        body = {
             "@odata.context": f"/odata/$metadata#{product_route}/{source_name}",
             "value": records,
         }
         if total_count is not None:
-            response["@odata.count"] = total_count
+            body["@odata.count"] = total_count
         if next_link:
-            response["@odata.nextLink"] = next_link
+            body["@odata.nextLink"] = next_link
 
-        return response
+        if cache_key is not None:
+            _result_cache_put(cache_key, body)
+        return body
 
     # Streaming
+    next_link = _compute_next_link(
+        base_path, select, filter_, orderby, skip, eff_top, total_count
+    )
+
     def row_iterator():
         meta = {"@odata.context": f"/odata/$metadata#{product_route}/{source_name}"}
         if total_count is not None:
@@ -402,27 +655,28 @@ def query_product_source(
         if next_link:
             meta["@odata.nextLink"] = next_link
 
-        head = json.dumps(meta, separators=(",", ":"))[:-1]
-        yield head
-        yield ',"value":['
+        buf = bytearray()
+        buf += orjson.dumps(meta)[:-1]  # strip closing '}'
+        buf += b',"value":['
 
         first = True
-        with _DUCKDB_LOCK:
-            cur = _DUCKDB_CONN.execute(sql, params)
-            columns = [d[0] for d in cur.description]
-
-            while True:
-                chunk = cur.fetchmany(1000)
-                if not chunk:
-                    break
-                for row in chunk:
+        cur = _cursor()
+        try:
+            reader = cur.execute(sql, params).fetch_record_batch(1000)
+            for batch in reader:
+                for obj in batch.to_pylist():
                     if not first:
-                        yield ","
+                        buf += b","
                     else:
                         first = False
-                    obj = {col: val for col, val in zip(columns, row)}
-                    yield json.dumps(obj, default=str, separators=(",", ":"))
-
-        yield "]}"  # close JSON
+                    buf += orjson.dumps(obj, default=str)
+                    if len(buf) >= _STREAM_BUF_LIMIT:
+                        yield bytes(buf)
+                        buf.clear()
+        finally:
+            cur.close()
+
+        buf += b"]}"  # close JSON
+        yield bytes(buf)
 
     return StreamingResponse(row_iterator(), media_type="application/json")
@@ -1,6 +1,8 @@
 # src/engine/security/authorization.py
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
+import threading
+import time
 
 from fastapi import HTTPException, status
 
@@ -8,21 +10,69 @@ from .config import AUTH_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Per-(dataset, principal) decision cache. Policy evaluation is on the
+# critical path of every request; decisions are stable for the TTL, so both
+# allows and denials are memoized. Entries: key -> (expires_at, exception).
+_DECISION_CACHE: Dict[tuple, Tuple[float, Optional[HTTPException]]] = {}
+_DECISION_CACHE_MAX = 10_000
+_DECISION_CACHE_LOCK = threading.Lock()
+
+
+def _principal_cache_key(principal: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    if principal is None:
+        return None
+    return (
+        principal.get("sub"),
+        principal.get(AUTH_CONFIG.app_id_claim or "azp"),
+    )
+
 
 def check_dataset_access(runtime, principal: Optional[Dict[str, Any]]) -> None:
+    """
+    Enforce per-dataset authPolicy, caching decisions for a short TTL
+    (AUTH_DECISION_CACHE_TTL_SECONDS, 0 disables caching).
+    """
+    if not getattr(AUTH_CONFIG, "enabled", False):
+        return
+
+    ttl = AUTH_CONFIG.decision_cache_ttl
+    if ttl <= 0:
+        _evaluate_dataset_access(runtime, principal)
+        return
+
+    key = (runtime.config.id, _principal_cache_key(principal))
+    now = time.time()
+    hit = _DECISION_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        if hit[1] is not None:
+            raise hit[1]
+        return
+
+    exc: Optional[HTTPException] = None
+    try:
+        _evaluate_dataset_access(runtime, principal)
+    except HTTPException as e:
+        exc = e
+
+    with _DECISION_CACHE_LOCK:
+        if len(_DECISION_CACHE) >= _DECISION_CACHE_MAX:
+            _DECISION_CACHE.clear()
+        _DECISION_CACHE[key] = (now + ttl, exc)
+
+    if exc is not None:
+        raise exc
+
+
+def _evaluate_dataset_access(runtime, principal: Optional[Dict[str, Any]]) -> None:
     """
     Enforce per-dataset authPolicy:
 
-      - If auth disabled globally -> allow.
       - If security.authPolicy == "none" -> allow.
       - If "optional":
           - with or without token -> allow.
       - If "required":
           - token (principal) must be present and valid (already validated).
     """
-    if not getattr(AUTH_CONFIG, "enabled", False):
-        return
-
     sec = getattr(runtime.config, "security", None)
     policy = sec.authPolicy if sec is not None else "none"
 
@@ -15,11 +15,21 @@ class AuthConfig:
     # NEW: where to read the application id from
     app_id_claim: Optional[str]
 
+    # How long PyJWKClient may serve cached JWKS signing keys before
+    # re-fetching from the IDP.
+    jwks_cache_lifespan: int
+
+    # How long to cache per-(dataset, principal) authorization decisions.
+    # 0 disables the cache.
+    decision_cache_ttl: float
+
     # Entitlements backend
     entitlements_mode: str  # "off", "static", "http"
     entitlements_static_file: Optional[str]
     entitlements_http_base_url: Optional[str]
     entitlements_http_timeout: float
+    # TTL for cached (app_id, dataset_id) entitlement decisions; 0 disables.
+    entitlements_cache_ttl: float
 
 
 def load_auth_config() -> AuthConfig:
@@ -33,10 +43,15 @@ def load_auth_config() -> AuthConfig:
 
     app_id_claim = os.getenv("AUTH_APP_ID_CLAIM", "azp")  # sensible default for many IDPs
 
+    jwks_cache_lifespan = int(os.getenv("AUTH_JWKS_CACHE_LIFESPAN_SECONDS", "5400"))
+
+    decision_cache_ttl = float(os.getenv("AUTH_DECISION_CACHE_TTL_SECONDS", "60"))
+
     entitlements_mode = os.getenv("ENTITLEMENTS_MODE", "off").lower()
     entitlements_static_file = os.getenv("ENTITLEMENTS_STATIC_FILE")
     entitlements_http_base_url = os.getenv("ENTITLEMENTS_HTTP_BASE_URL")
     entitlements_http_timeout = float(os.getenv("ENTITLEMENTS_HTTP_TIMEOUT_SECONDS", "2"))
+    entitlements_cache_ttl = float(os.getenv("ENTITLEMENTS_CACHE_TTL_SECONDS", "60"))
 
     return AuthConfig(
         enabled=enabled,
@@ -45,10 +60,13 @@ def load_auth_config() -> AuthConfig:
         audience=audience,
         algorithms=algorithms,
         app_id_claim=app_id_claim,
+        jwks_cache_lifespan=jwks_cache_lifespan,
+        decision_cache_ttl=decision_cache_ttl,
         entitlements_mode=entitlements_mode,
         entitlements_static_file=entitlements_static_file,
         entitlements_http_base_url=entitlements_http_base_url,
         entitlements_http_timeout=entitlements_http_timeout,
+        entitlements_cache_ttl=entitlements_cache_ttl,
     )
 
 
@@ -8,7 +8,7 @@ import json
 import yaml  # you already use pyyaml in the project
 import os
 
-import requests  # if you don’t have it yet, add to dependencies
+import httpx
 
 from .config import AUTH_CONFIG
 
@@ -95,13 +95,18 @@ class HttpEntitlementsBackend(EntitlementsBackend):
 
     def __init__(self, base_url: str, timeout: float = 2.0):
         self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
+        # Pooled client: keep-alive connections are reused across checks,
+        # so steady-state lookups skip TCP/TLS handshakes entirely.
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
 
     def is_allowed(self, app_id: str, dataset_id: str) -> bool:
         url = f"{self._base_url}/entitlements"
         params = {"app_id": app_id, "dataset_id": dataset_id}
         try:
-            resp = requests.get(url, params=params, timeout=self._timeout)
+            resp = self._client.get(url, params=params)
             resp.raise_for_status()
             data = resp.json()
             return bool(data.get("allowed", False))
@@ -117,6 +122,39 @@ class HttpEntitlementsBackend(EntitlementsBackend):
             return False
 
 
+class CachingEntitlementsBackend(EntitlementsBackend):
+    """
+    TTL cache in front of another backend.
+
+    Every authorized request consults entitlements, which for the static
+    backend means a reload-check under a lock and for the HTTP backend a
+    network round-trip; caching per (app_id, dataset_id) amortizes both.
+    """
+
+    def __init__(self, inner: EntitlementsBackend, ttl_sec: float = 60.0, maxsize: int = 10_000):
+        self._inner = inner
+        self._ttl_sec = ttl_sec
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: Dict[tuple, tuple] = {}  # key -> (expires_at, allowed)
+
+    def is_allowed(self, app_id: str, dataset_id: str) -> bool:
+        key = (app_id, dataset_id)
+        now = time.time()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        allowed = self._inner.is_allowed(app_id, dataset_id)
+
+        with self._lock:
+            if len(self._cache) >= self._maxsize:
+                self._cache.clear()
+            self._cache[key] = (now + self._ttl_sec, allowed)
+
+        return allowed
+
+
 def build_entitlements_backend() -> EntitlementsBackend:
     mode = AUTH_CONFIG.entitlements_mode
 
@@ -128,19 +166,24 @@ def build_entitlements_backend() -> EntitlementsBackend:
         if not AUTH_CONFIG.entitlements_static_file:
             logger.warning("ENTITLEMENTS_STATIC_FILE not set; falling back to 'off' behaviour.")
             return NoopEntitlementsBackend()
-        return StaticFileEntitlementsBackend(AUTH_CONFIG.entitlements_static_file)
-
-    if mode == "http":
+        backend = StaticFileEntitlementsBackend(AUTH_CONFIG.entitlements_static_file)
+    elif mode == "http":
         if not AUTH_CONFIG.entitlements_http_base_url:
             logger.warning("ENTITLEMENTS_HTTP_BASE_URL not set; falling back to 'off' behaviour.")
             return NoopEntitlementsBackend()
-        return HttpEntitlementsBackend(
+        backend = HttpEntitlementsBackend(
             AUTH_CONFIG.entitlements_http_base_url,
             AUTH_CONFIG.entitlements_http_timeout,
         )
+    else:
+        logger.warning("Unknown ENTITLEMENTS_MODE=%r; falling back to 'off'.", mode)
+        return NoopEntitlementsBackend()
 
-    logger.warning("Unknown ENTITLEMENTS_MODE=%r; falling back to 'off'.", mode)
-    return NoopEntitlementsBackend()
+    if AUTH_CONFIG.entitlements_cache_ttl > 0:
+        backend = CachingEntitlementsBackend(
+            backend, ttl_sec=AUTH_CONFIG.entitlements_cache_ttl
+        )
+    return backend
 
 
 ENTITLEMENTS_BACKEND: EntitlementsBackend = build_entitlements_backend()
@@ -1,6 +1,10 @@
 # src/engine/security/jwt_auth.py
 from typing import Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
 import logging
+import threading
+import time
 
 import jwt
 from jwt import PyJWKClient
@@ -11,13 +15,29 @@ logger = logging.getLogger(__name__)
 
 _jwk_client: Optional[PyJWKClient] = None
 
+# Validated-token cache: RSA signature verification costs ~100µs-1ms per
+# request, but a replayed token inside its validity window can't change.
+# Keyed by SHA-256 of the token; entries are evicted once exp approaches.
+_TOKEN_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_EXP_SLACK_SEC = 5
+
 
 def _get_jwk_client() -> PyJWKClient:
     global _jwk_client
     if _jwk_client is None:
         if not AUTH_CONFIG.jwks_url:
             raise RuntimeError("AUTH_JWKS_URL not set but auth is enabled.")
-        _jwk_client = PyJWKClient(AUTH_CONFIG.jwks_url)
+        # cache_keys keeps resolved signing keys per kid for the configured
+        # lifespan, so only the first request per key (or per refresh
+        # window) pays the JWKS fetch; everything else stays off the
+        # network on the request path.
+        _jwk_client = PyJWKClient(
+            AUTH_CONFIG.jwks_url,
+            cache_keys=True,
+            lifespan=AUTH_CONFIG.jwks_cache_lifespan,
+        )
     return _jwk_client
 
 
@@ -25,8 +45,21 @@ def decode_jwt(token: str) -> Dict[str, Any]:
     """
     Validate and decode a JWT access token using JWKS.
 
+    Replayed tokens are served from a digest-keyed cache until shortly
+    before their exp, skipping the RSA verification.
+
     Raises jwt.PyJWTError on validation error.
     """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None:
+            if cached.get("exp", 0) > now + _TOKEN_EXP_SLACK_SEC:
+                _TOKEN_CACHE.move_to_end(cache_key)
+                return cached
+            del _TOKEN_CACHE[cache_key]
+
     jwk_client = _get_jwk_client()
     signing_key = jwk_client.get_signing_key_from_jwt(token)
 
@@ -40,4 +73,13 @@ def decode_jwt(token: str) -> Dict[str, Any]:
         issuer=AUTH_CONFIG.issuer,
         options=options,
     )
+
+    # Only tokens with an exp can be aged out, so only those are cached.
+    if decoded.get("exp"):
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[cache_key] = decoded
+            _TOKEN_CACHE.move_to_end(cache_key)
+            while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.popitem(last=False)
+
     return decoded
@@ -1,12 +1,22 @@
 # src/operator/handlers/dataproduct.py
 import datetime
+import functools
 import json
 import os
+import threading
 from typing import Any, Dict, List, Optional
 
 import kopf
+import requests
 from kubernetes import client, config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from kubernetes.client.exceptions import ApiException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GROUP = os.getenv("DATA_PRODUCT_CRD_GROUP", "sripathiacharya.github.io")
 VERSION = os.getenv("DATA_PRODUCT_CRD_VERSION", "v1alpha1")
@@ -29,12 +39,79 @@ SHARED_METADATA_CM_NAME = os.getenv("SHARED_METADATA_CM_NAME", "data-product-hub
 DATA_ROOT_PATH = os.getenv("DATA_ROOT_PATH", "/data-product-hub-data")
 DATA_PVC_NAME = os.getenv("DATA_PVC_NAME", "")
 
+_k8s_config_loaded = False
+
+
 def _load_k8s_config():
-    # In-cluster config if running in k8s; local config if running kopf locally
+    # In-cluster config if running in k8s; local config if running kopf
+    # locally. Loading re-reads kubeconfig from disk, so do it once per
+    # process instead of at the top of every helper.
+    global _k8s_config_loaded
+    if _k8s_config_loaded:
+        return
     try:
         config.load_incluster_config()
     except config.ConfigException:
         config.load_kube_config()
+    _k8s_config_loaded = True
+
+
+@functools.lru_cache(maxsize=None)
+def _core_v1() -> client.CoreV1Api:
+    _load_k8s_config()
+    return client.CoreV1Api()
+
+
+@functools.lru_cache(maxsize=None)
+def _apps_v1() -> client.AppsV1Api:
+    _load_k8s_config()
+    return client.AppsV1Api()
+
+
+@functools.lru_cache(maxsize=None)
+def _networking_v1() -> client.NetworkingV1Api:
+    _load_k8s_config()
+    return client.NetworkingV1Api()
+
+
+@functools.lru_cache(maxsize=None)
+def _api_client() -> client.ApiClient:
+    _load_k8s_config()
+    return client.ApiClient()
+
+
+FIELD_MANAGER = os.getenv("FIELD_MANAGER", "data-product-hub-operator")
+
+
+def _server_side_apply(resource_path: str, body: Any) -> None:
+    """
+    Create-or-update a resource with Kubernetes server-side apply: a single
+    PATCH replaces the read-then-patch-or-create dance (two API calls and a
+    404 branch per helper), and the API server reconciles field ownership
+    under our fieldManager. The body must carry apiVersion and kind.
+    """
+    api_client = _api_client()
+    payload = api_client.sanitize_for_serialization(body)
+    api_client.call_api(
+        resource_path,
+        "PATCH",
+        header_params={
+            "Content-Type": "application/apply-patch+yaml",
+            "Accept": "application/json",
+        },
+        query_params=[("fieldManager", FIELD_MANAGER), ("force", "true")],
+        body=payload,
+        auth_settings=["BearerToken"],
+        response_type="object",
+    )
+
+
+def _dumps_metadata(items: Any) -> str:
+    # ConfigMap data values must be str; orjson (when available) emits the
+    # compact form several times faster than stdlib json.
+    if orjson is not None:
+        return orjson.dumps(items).decode()
+    return json.dumps(items, separators=(",", ":"), ensure_ascii=False)
 
 
 def _get_ingress_annotations() -> Dict[str, str]:
@@ -88,8 +165,7 @@ def _bump_shared_engine_revision(namespace: str, logger) -> None:
         logger.warning("SHARED_ENGINE_DEPLOYMENT not set; cannot bump engine revision.")
         return
 
-    _load_k8s_config()
-    apps = client.AppsV1Api()
+    apps = _apps_v1()
 
     # Use a simple timestamp; anything that changes the value will trigger a rollout.
     revision = datetime.datetime.utcnow().isoformat()
@@ -122,59 +198,181 @@ def _bump_shared_engine_revision(namespace: str, logger) -> None:
         )
         # Don't raise; we don't want to fail the reconcile just because restart failed.
 
-def _update_shared_metadata(namespace: str, name: str, spec: Dict[str, Any]) -> None:
+# Applying N DataProducts at once used to trigger N engine rollouts in a
+# row. Bumps are debounced per namespace: each request (re)starts that
+# namespace's timer, and only the last one in a burst actually patches the
+# Deployment.
+BUMP_DEBOUNCE_SECONDS = float(os.getenv("ENGINE_BUMP_DEBOUNCE_SECONDS", "5"))
+
+_pending_bump_lock = threading.Lock()
+_pending_bump_timers: Dict[str, threading.Timer] = {}
+
+
+def _schedule_engine_bump(namespace: str, logger) -> None:
     """
-    Upsert this DataProduct into the shared dataproducts.json ConfigMap.
+    Coalesce a burst of reconciles into a single shared-engine rollout for
+    the given namespace. Timers are keyed per namespace so a bump pending
+    for one namespace is never cancelled by activity in another.
     """
-    _load_k8s_config()
-    v1 = client.CoreV1Api()
+    if BUMP_DEBOUNCE_SECONDS <= 0:
+        _bump_shared_engine_revision(namespace, logger)
+        return
+
+    with _pending_bump_lock:
+        existing = _pending_bump_timers.get(namespace)
+        if existing is not None:
+            existing.cancel()
+        timer = threading.Timer(
+            BUMP_DEBOUNCE_SECONDS, _do_engine_bump, args=(namespace, logger)
+        )
+        timer.daemon = True
+        _pending_bump_timers[namespace] = timer
+        timer.start()
+
+
+def _do_engine_bump(namespace: str, logger) -> None:
+    with _pending_bump_lock:
+        _pending_bump_timers.pop(namespace, None)
 
+    # This runs on a bare timer thread: an uncaught exception would die
+    # silently and drop the bump (pre-debounce it propagated to kopf and
+    # was retried), so any failure reschedules another debounce window.
+    try:
+        # If a rollout is still in progress, defer another debounce window
+        # rather than piling a second restart onto it.
+        try:
+            deploy = _apps_v1().read_namespaced_deployment(
+                SHARED_ENGINE_DEPLOYMENT, namespace
+            )
+            status = deploy.status
+            if (
+                status is not None
+                and deploy.metadata.generation
+                and (status.observed_generation or 0) < deploy.metadata.generation
+            ):
+                logger.info(
+                    "Shared engine rollout in progress; deferring revision bump."
+                )
+                _schedule_engine_bump(namespace, logger)
+                return
+        except ApiException:
+            # Can't tell; just bump.
+            pass
+
+        _bump_shared_engine_revision(namespace, logger)
+    except Exception:
+        logger.exception(
+            "Engine revision bump for %s failed; retrying next window.", namespace
+        )
+        _schedule_engine_bump(namespace, logger)
+
+
+# Namespaces whose legacy aggregate dataproducts.json key has been
+# confirmed absent or migrated to per-product keys; steady-state upserts in
+# these namespaces stay a single read-free patch.
+_LEGACY_AGGREGATE_MIGRATED: set = set()
+
+
+def _legacy_aggregate_migration(v1, namespace: str, exclude: str) -> Dict[str, Any]:
+    """
+    Build the patch entries that migrate the legacy aggregate key.
+
+    Every product still living only in the aggregate (kopf does not re-fire
+    handlers for untouched CRs, so siblings may never reconcile themselves)
+    is split out into its own "<id>.json" key in the same patch that nulls
+    the legacy key — nothing is discarded. Returns {} when there is
+    nothing to migrate.
+    """
     try:
         cm = v1.read_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace)
-    except client.exceptions.ApiException as e:
+    except ApiException as e:
+        if e.status == 404:
+            return {}
+        raise
+
+    raw = (cm.data or {}).get("dataproducts.json")
+    if raw is None:
+        return {}
+
+    try:
+        items = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, ValueError):
+        items = []
+
+    entries: Dict[str, Any] = {"dataproducts.json": None}
+    for item in items:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if not item_id or item_id == exclude:
+            continue
+        entries[f"{item_id}.json"] = _dumps_metadata(item)
+    return entries
+
+
+def _update_shared_metadata(namespace: str, name: str, spec: Dict[str, Any]) -> None:
+    """
+    Upsert this DataProduct into the shared metadata ConfigMap.
+
+    One key per product ("<name>.json"), so an upsert is a strategic-merge
+    patch of a single key — O(1) payload and etcd write amplification
+    instead of read-modify-writing the whole product list. The engine
+    loads the mounted ConfigMap directory and globs *.json. The first
+    reconcile per namespace additionally migrates any legacy aggregate key
+    into per-product keys.
+    """
+    v1 = _core_v1()
+    payload = _dumps_metadata(_dataproduct_to_metadata(spec, name, namespace))
+    data: Dict[str, Any] = {f"{name}.json": payload}
+
+    if namespace not in _LEGACY_AGGREGATE_MIGRATED:
+        data.update(_legacy_aggregate_migration(v1, namespace, exclude=name))
+
+    try:
+        v1.patch_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace, {"data": data})
+    except ApiException as e:
         if e.status == 404:
             cm = client.V1ConfigMap(
                 metadata=client.V1ObjectMeta(name=SHARED_METADATA_CM_NAME, namespace=namespace),
-                data={"dataproducts.json": "[]"},
+                # Creates can't carry the null tombstone entry.
+                data={k: v for k, v in data.items() if v is not None},
             )
             v1.create_namespaced_config_map(namespace, cm)
         else:
             raise
 
-    existing_raw = cm.data.get("dataproducts.json", "[]")
-    try:
-        items: List[Dict[str, Any]] = json.loads(existing_raw)
-    except json.JSONDecodeError:
-        items = []
-
-    items = [item for item in items if item.get("id") != name]
-
-    items.append(_dataproduct_to_metadata(spec, name, namespace))
-
-    cm.data["dataproducts.json"] = json.dumps(items, indent=2)
-    v1.patch_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace, cm)
+    _LEGACY_AGGREGATE_MIGRATED.add(namespace)
 
 
 def _remove_from_shared_metadata(namespace: str, name: str) -> None:
-    _load_k8s_config()
-    v1 = client.CoreV1Api()
+    v1 = _core_v1()
+
+    # Setting a key to None deletes it under strategic merge. Migrate the
+    # legacy aggregate first if present, so the removed product can't
+    # resurrect from it and its siblings are preserved.
+    data: Dict[str, Any] = {f"{name}.json": None}
+    if namespace not in _LEGACY_AGGREGATE_MIGRATED:
+        data.update(_legacy_aggregate_migration(v1, namespace, exclude=name))
 
     try:
-        cm = v1.read_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace)
-    except client.exceptions.ApiException as e:
+        v1.patch_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace, {"data": data})
+    except ApiException as e:
         if e.status == 404:
             return
         raise
 
-    existing_raw = cm.data.get("dataproducts.json", "[]")
-    try:
-        items: List[Dict[str, Any]] = json.loads(existing_raw)
-    except json.JSONDecodeError:
-        items = []
+    _LEGACY_AGGREGATE_MIGRATED.add(namespace)
+
 
-    new_items = [item for item in items if item.get("id") != name]
-    cm.data["dataproducts.json"] = json.dumps(new_items, indent=2)
-    v1.patch_namespaced_config_map(SHARED_METADATA_CM_NAME, namespace, cm)
+# One pooled session for engine reload calls: back-to-back reconciles reuse
+# the TCP connection instead of opening a fresh socket per DataProduct.
+_reload_session = requests.Session()
+_reload_session.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
 
 
 def _notify_engine_reload(namespace: str, service: str, port: int) -> None:
@@ -182,13 +380,11 @@ def _notify_engine_reload(namespace: str, service: str, port: int) -> None:
     Call /internal/reload-config on the given engine Service.
     We use the cluster DNS name so this is internal-only.
     """
-    import requests
-
     base_url = f"http://{service}.{namespace}.svc.cluster.local:{port}"
     url = base_url + ENGINE_RELOAD_PATH
 
     try:
-        resp = requests.post(url, timeout=5)
+        resp = _reload_session.post(url, timeout=5)
         resp.raise_for_status()
     except Exception as exc:
         kopf.logger.error(f"Failed to reload engine at {url}: {exc}")
@@ -204,15 +400,14 @@ def _ensure_ingress_for_dp(
     """
     Create or update an Ingress per DataProduct, routing to the given service.
     """
-    _load_k8s_config()
-    net = client.NetworkingV1Api()
-
     ingress_name = f"dp-{name}"
     path = f"{INGRESS_PATH_PREFIX}{api_path}"
 
     annotations = _get_ingress_annotations()
 
     body = client.V1Ingress(
+        api_version="networking.k8s.io/v1",
+        kind="Ingress",
         metadata=client.V1ObjectMeta(
             name=ingress_name,
             namespace=namespace,
@@ -248,19 +443,14 @@ def _ensure_ingress_for_dp(
         ),
     )
 
-    try:
-        net.read_namespaced_ingress(ingress_name, namespace)
-        net.patch_namespaced_ingress(ingress_name, namespace, body)
-    except client.exceptions.ApiException as e:
-        if e.status == 404:
-            net.create_namespaced_ingress(namespace, body)
-        else:
-            raise
+    _server_side_apply(
+        f"/apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses/{ingress_name}",
+        body,
+    )
 
 
 def _delete_ingress_for_dp(namespace: str, name: str) -> None:
-    _load_k8s_config()
-    net = client.NetworkingV1Api()
+    net = _networking_v1()
     ingress_name = f"dp-{name}"
     try:
         net.delete_namespaced_ingress(ingress_name, namespace)
@@ -288,27 +478,22 @@ def _ensure_dedicated_metadata(namespace: str, name: str, spec: Dict[str, Any])
     Create/update dedicated metadata ConfigMap with a single DataProduct.
     Returns the ConfigMap name.
     """
-    _load_k8s_config()
-    v1 = client.CoreV1Api()
     names = _dedicated_names(name)
     cm_name = names["cm"]
 
     metadata_list = [_dataproduct_to_metadata(spec, name, namespace)]
-    data = {"dataproducts.json": json.dumps(metadata_list, indent=2)}
+    data = {"dataproducts.json": _dumps_metadata(metadata_list)}
 
     body = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
         metadata=client.V1ObjectMeta(name=cm_name, namespace=namespace),
         data=data,
     )
 
-    try:
-        v1.read_namespaced_config_map(cm_name, namespace)
-        v1.patch_namespaced_config_map(cm_name, namespace, body)
-    except client.exceptions.ApiException as e:
-        if e.status == 404:
-            v1.create_namespaced_config_map(namespace, body)
-        else:
-            raise
+    _server_side_apply(
+        f"/api/v1/namespaces/{namespace}/configmaps/{cm_name}", body
+    )
 
     return cm_name
 
@@ -318,10 +503,6 @@ def _ensure_dedicated_engine(namespace: str, name: str, cm_name: str) -> str:
     Ensure dedicated engine Deployment + Service exist for this DataProduct.
     Returns service name.
     """
-    _load_k8s_config()
-    apps = client.AppsV1Api()
-    v1 = client.CoreV1Api()
-
     names = _dedicated_names(name)
     deploy_name = names["deploy"]
     svc_name = names["svc"]
@@ -407,21 +588,21 @@ def _ensure_dedicated_engine(namespace: str, name: str, cm_name: str) -> str:
     )
 
     deploy_body = client.V1Deployment(
+        api_version="apps/v1",
+        kind="Deployment",
         metadata=client.V1ObjectMeta(name=deploy_name, namespace=namespace),
         spec=deploy_spec,
     )
 
-    try:
-        apps.read_namespaced_deployment(deploy_name, namespace)
-        apps.patch_namespaced_deployment(deploy_name, namespace, deploy_body)
-    except client.exceptions.ApiException as e:
-        if e.status == 404:
-            apps.create_namespaced_deployment(namespace, deploy_body)
-        else:
-            raise
+    _server_side_apply(
+        f"/apis/apps/v1/namespaces/{namespace}/deployments/{deploy_name}",
+        deploy_body,
+    )
 
     # Service
     svc_body = client.V1Service(
+        api_version="v1",
+        kind="Service",
         metadata=client.V1ObjectMeta(name=svc_name, namespace=namespace),
         spec=client.V1ServiceSpec(
             selector=labels,
@@ -429,23 +610,17 @@ def _ensure_dedicated_engine(namespace: str, name: str, cm_name: str) -> str:
         ),
     )
 
-    try:
-        v1.read_namespaced_service(svc_name, namespace)
-        v1.patch_namespaced_service(svc_name, namespace, svc_body)
-    except client.exceptions.ApiException as e:
-        if e.status == 404:
-            v1.create_namespaced_service(namespace, svc_body)
-        else:
-            raise
+    _server_side_apply(
+        f"/api/v1/namespaces/{namespace}/services/{svc_name}", svc_body
+    )
 
     return svc_name
 
 
 
 def _delete_dedicated_resources(namespace: str, name: str) -> None:
-    _load_k8s_config()
-    apps = client.AppsV1Api()
-    v1 = client.CoreV1Api()
+    apps = _apps_v1()
+    v1 = _core_v1()
     names = _dedicated_names(name)
 
     for kind, delete_fn in [
@@ -481,7 +656,7 @@ def dataproduct_create_or_update(spec, name, namespace, logger, **kwargs):
     if mode == "Shared":
         # Ensure shared metadata & reload shared engine
         _update_shared_metadata(namespace, name, spec)
-        _bump_shared_engine_revision(namespace, logger)
+        _schedule_engine_bump(namespace, logger)
 
         # Shared engine ingress
         _ensure_ingress_for_dp(
@@ -527,7 +702,7 @@ def dataproduct_delete(spec, name, namespace, logger, **kwargs):
 
     if mode == "Shared":
         _remove_from_shared_metadata(namespace, name)
-        _bump_shared_engine_revision(namespace, logger)
+        _schedule_engine_bump(namespace, logger)
     elif mode == "Dedicated":
         _delete_dedicated_resources(namespace, name)
 
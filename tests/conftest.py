@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from engine.main import app
+from engine.odata.registry import load_config_dir
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Load the data-product configs once for the whole test session and share
+    a single TestClient, instead of re-reading configs (and parquet) per
+    test module.
+    """
+    config_dir = Path(__file__).resolve().parents[1] / "config" / "data-products"
+    load_config_dir(config_dir)
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,25 +1,4 @@
-from pathlib import Path
-
-from fastapi.testclient import TestClient
-
-from engine.main import app
-from engine.odata.registry import load_config_dir
-
-
-def setup_module(module):
-    """
-    Ensure configs are loaded when tests run.
-    If your main.py already calls load_config_dir at import time,
-    you may not need this, but it's explicit and safe.
-    """
-    config_dir = Path(__file__).resolve().parents[1] / "config" / "data-products"
-    load_config_dir(config_dir)
-
-
-client = TestClient(app)
-
-
-def test_metadata_lists_southafrica_product():
+def test_metadata_lists_southafrica_product(client):
     resp = client.get("/odata/$metadata")
     assert resp.status_code == 200
     data = resp.json()
@@ -28,10 +7,10 @@ def test_metadata_lists_southafrica_product():
     assert "southafrica-scheduled-outage-dataset" in ids
 
 
-def test_southafrica_basic_query():
+def test_southafrica_basic_query(client):
     resp = client.get("/odata/southafrica-scheduled-outage-dataset?$top=5")
     assert resp.status_code == 200
-    data = resp.json()
+    data = resp.json()["value"]
     assert isinstance(data, list)
     assert len(data) <= 5
 
@@ -50,13 +29,13 @@ def test_southafrica_basic_query():
         assert "end_time" in row
 
 
-def test_southafrica_filter_by_province():
+def test_southafrica_filter_by_province(client):
     resp = client.get(
         "/odata/southafrica-scheduled-outage-dataset?"
         "$filter=province eq 'Eastern Cape' and city eq 'Amahlathi'&$top=5"
     )
     assert resp.status_code == 200
-    data = resp.json()
+    data = resp.json()["value"]
 
     for row in data:
         assert row["province"] == "Eastern Cape"